@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Generate the CFFI modules used by zmin/_cffi_backend.py
+
+- ffibuilder: out-of-line ABI mode. Writes zmin/_cffi_ext.py (plain
+  Python, no C compiler needed); the shared library is opened at runtime
+  with ffi.dlopen.
+- fast_ffibuilder: out-of-line API mode. Compiles zmin._fast_minify, a
+  small extension linked against libzmin whose calls go straight to C
+  instead of through libffi. Needs a compiler; the backend falls back to
+  ABI mode (or zmin.py to ctypes) when it is not built.
+
+setup.py runs both through cffi_modules when cffi is installed, and copies
+the shared library into the package, where zmin._fast_minify loads it from.
+They can also be built directly by running this file from this directory,
+which copies the library as well.
+"""
+
+import os
+import shutil
+import sys
+
+from cffi import FFI  # type: ignore
+
+here = os.path.abspath(os.path.dirname(__file__))
+
+# Directory containing the zmin shared library to link against (as in setup.py)
+lib_dir = os.environ.get("ZMIN_LIB_DIR", os.path.join(here, "..", "..", "zig-out", "lib"))
+
+if sys.platform == "win32":
+    lib_name = "zmin.dll"
+elif sys.platform == "darwin":
+    lib_name = "libzmin.dylib"
+else:
+    lib_name = "libzmin.so"
+
+# Subset of zmin.h used by the backend (cdef does not take preprocessor lines)
+CDEF = """
+    typedef struct {
+        char* data;
+        size_t size;
+        int error_code;
+    } ZminResult;
+
+    void zmin_init(void);
+    ZminResult zmin_minify_mode(const char* input, size_t input_size, int mode);
+    int zmin_validate(const char* input, size_t input_size);
+    void zmin_free_result_data(char* data, size_t size);
+    const char* zmin_get_error_message(int error_code);
+"""
+
+ffibuilder = FFI()
+ffibuilder.cdef(CDEF)
+ffibuilder.set_source("zmin._cffi_ext", None)
+
+fast_ffibuilder = FFI()
+fast_ffibuilder.cdef(CDEF)
+fast_ffibuilder.set_source(
+    "zmin._fast_minify",
+    '#include "zmin.h"',
+    include_dirs=[os.path.join(here, "zmin")],
+    library_dirs=[lib_dir],
+    libraries=["zmin"],
+    runtime_library_dirs=[] if os.name == "nt" else ["$ORIGIN"],
+)
+
+if __name__ == "__main__":
+    ffibuilder.compile(verbose=True)
+    
+    # The extension only searches its own directory ($ORIGIN) for the library
+    source = os.path.join(lib_dir, lib_name)
+    target = os.path.join(here, "zmin", lib_name)
+    if os.path.exists(source) and os.path.abspath(source) != os.path.abspath(target):
+        shutil.copyfile(source, target)
+    fast_ffibuilder.compile(verbose=True)
@@ -1,12 +1,19 @@
 #!/usr/bin/env python3
 
 import os
+import sys
 try:
-    from setuptools import setup, find_packages  # type: ignore
+    from setuptools import setup, find_packages, Extension  # type: ignore
+    from setuptools.command.build_ext import build_ext  # type: ignore
 except ImportError:
     print("setuptools is required. Install with: pip install setuptools")
     exit(1)
 
+try:
+    from Cython.Build import cythonize  # type: ignore
+except ImportError:
+    cythonize = None
+
 # Read version from package
 here = os.path.abspath(os.path.dirname(__file__))
 
@@ -20,6 +27,77 @@ if os.path.exists(os.path.join(here, "requirements.txt")):
     with open(os.path.join(here, "requirements.txt"), "r", encoding="utf-8") as f:
         install_requires = [line.strip() for line in f if line.strip() and not line.startswith("#")]
 
+# Directory containing the zmin shared library to link the extension against
+lib_dir = os.environ.get("ZMIN_LIB_DIR", os.path.join(here, "..", "..", "zig-out", "lib"))
+
+if sys.platform == "win32":
+    lib_name = "zmin.dll"
+elif sys.platform == "darwin":
+    lib_name = "libzmin.dylib"
+else:
+    lib_name = "libzmin.so"
+
+
+class optional_build_ext(build_ext):
+    """Build extensions, falling back to the ctypes bindings on failure"""
+
+    def run(self):
+        self.copy_library()
+        try:
+            super().run()
+        except Exception as e:
+            print(f"warning: could not build zmin extensions ({e}); using ctypes bindings")
+
+    def copy_library(self):
+        """
+        Copy the shared library into the built package
+        
+        The extensions only search their own directory ($ORIGIN) for it at
+        run time, and the ctypes bindings look there first as well.
+        """
+        source = os.path.join(lib_dir, lib_name)
+        if not os.path.exists(source):
+            print(f"warning: {source} not found; build it with `zig build c-api` or set ZMIN_LIB_DIR")
+            return
+        package_dir = os.path.dirname(self.get_ext_fullpath("zmin._core"))
+        target = os.path.join(package_dir, lib_name)
+        if os.path.abspath(source) != os.path.abspath(target):
+            self.mkpath(package_dir)
+            self.copy_file(source, target)
+
+    def build_extension(self, ext):
+        try:
+            super().build_extension(ext)
+        except Exception as e:
+            print(f"warning: could not build {ext.name} ({e}); using ctypes bindings")
+
+
+# Cython extension for the minify/validate hot path (optional)
+ext_modules = []
+if cythonize is not None:
+    ext_modules = cythonize(
+        [
+            Extension(
+                "zmin._core",
+                ["zmin/_core.pyx"],
+                include_dirs=["zmin"],
+                library_dirs=[lib_dir],
+                libraries=["zmin"],
+                runtime_library_dirs=[] if os.name == "nt" else ["$ORIGIN"],
+            )
+        ],
+        compiler_directives={"language_level": "3"},
+    )
+
+# CFFI modules for the CFFI backend (optional): zmin/_cffi_ext.py, and the
+# compiled zmin._fast_minify, whose build failures optional_build_ext ignores
+setup_kwargs = {}
+try:
+    import cffi  # type: ignore  # noqa: F401
+    setup_kwargs["cffi_modules"] = ["build_cffi.py:ffibuilder", "build_cffi.py:fast_ffibuilder"]
+except ImportError:
+    pass
+
 setup(
     name="zmin",
     version="1.0.0",
@@ -36,8 +114,10 @@ setup(
     },
     packages=find_packages(),
     package_data={
-        "zmin": ["*.so", "*.dll", "*.dylib"],
+        "zmin": ["*.so", "*.dll", "*.dylib", "*.h", "*.pyx"],
     },
+    ext_modules=ext_modules,
+    cmdclass={"build_ext": optional_build_ext},
     include_package_data=True,
     classifiers=[
         # Development status
@@ -99,6 +179,9 @@ setup(
             "pytest>=7.0.0",
             "pytest-benchmark>=4.0.0",
         ],
+        "cffi": [
+            "cffi>=1.15.0",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -108,4 +191,5 @@ setup(
     },
     zip_safe=False,
     platforms=["any"],
+    **setup_kwargs,
 )
\ No newline at end of file
@@ -5,6 +5,7 @@ Simple test for zmin Python bindings
 
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 # Add the parent directory to the path so we can import zmin
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -39,6 +40,11 @@ def test_basic_functionality():
         is_valid = zmin.validate(test_json)
         print(f"✓ Validation successful: {is_valid}")
         
+        # Bytes validation must agree with str validation
+        assert zmin.validate_bytes(test_json.encode('utf-8')) == is_valid
+        assert zmin.validate_bytes(bytearray(test_json.encode('utf-8'))) == is_valid
+        print(f"✓ Bytes validation successful")
+        
         # Test different modes
         eco_result = zmin.minify(test_json, zmin.ProcessingMode.ECO)
         sport_result = zmin.minify(test_json, zmin.ProcessingMode.SPORT)
@@ -52,6 +58,36 @@ def test_basic_functionality():
         print(f"✗ Test failed: {e}")
         return False
 
+def test_backend():
+    """Test that a built Cython extension is actually used"""
+    print("\nTesting native backend selection...")
+    
+    try:
+        import importlib.machinery
+        import zmin.zmin as bindings
+        
+        package_dir = os.path.dirname(bindings.__file__)
+        built = any(
+            os.path.exists(os.path.join(package_dir, "_core" + suffix))
+            for suffix in importlib.machinery.EXTENSION_SUFFIXES
+        )
+        if not built:
+            print("✓ Cython extension not built, using ctypes")
+            return True
+        
+        # An import that fails is swallowed in favor of ctypes, so check
+        # that the extension that exists was really picked up
+        if getattr(bindings._core, "__name__", None) != "zmin._core":
+            print(f"✗ Cython extension is built but not used (backend: {bindings._core})")
+            return False
+        
+        print("✓ Using the Cython extension")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Test failed: {e}")
+        return False
+
 def test_error_handling():
     """Test error handling"""
     print("\nTesting error handling...")
@@ -69,6 +105,219 @@ def test_error_handling():
     
     return True
 
+def test_batch():
+    """Test batch minification"""
+    print("\nTesting batch minification...")
+    
+    try:
+        inputs = [b'{ "a" : 1 }', b'[ 1, 2, 3 ]', b'"text"']
+        outputs = zmin.minify_many(inputs)
+        
+        if outputs != [b'{"a":1}', b'[1,2,3]', b'"text"']:
+            print(f"✗ Unexpected batch output: {outputs}")
+            return False
+        
+        if zmin.minify_many(tuple(inputs)) != outputs:
+            print("✗ Unexpected batch output for a tuple")
+            return False
+        
+        print(f"✓ Batch minification successful: {len(outputs)} documents")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Test failed: {e}")
+        return False
+
+def test_reformat():
+    """Test single-pass pretty printing"""
+    print("\nTesting reformat...")
+    
+    try:
+        import json
+        data = {"a": [1, 2, {"b": None}], "c": {}, "d": []}
+        source = json.dumps(data).encode('utf-8')
+        
+        for indent in (2, 4):
+            output = zmin.reformat(source, pretty=True, indent=indent)
+            if output != json.dumps(data, indent=indent).encode('utf-8'):
+                print(f"✗ Unexpected pretty output: {output}")
+                return False
+        
+        if zmin.reformat(source) != zmin.minify_bytes(source):
+            print("✗ Non-pretty reformat should minify")
+            return False
+        
+        for source in (b'{"a": [1', b'', b'  ', b'-', b'1.', b'1e+'):
+            try:
+                zmin.reformat(source, pretty=True)
+                print(f"✗ Should have raised an error for incomplete JSON {source!r}")
+                return False
+            except zmin.ZminError:
+                pass
+        
+        for source in (b'1', b'-1.5', b'2e+10', b'"x"', b'true'):
+            if zmin.reformat(source, pretty=True) != source:
+                print(f"✗ Unexpected pretty output for {source!r}")
+                return False
+        
+        print("✓ Reformat successful")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Test failed: {e}")
+        return False
+
+def test_minify_file():
+    """Test streaming file minification"""
+    print("\nTesting file minification...")
+    
+    try:
+        import tempfile
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "data.json")
+            with open(path, "w") as f:
+                f.write('{ "a" : [ 1, 2, 3 ] }')
+            
+            # In place, which must not truncate the input before reading it
+            zmin.minify_file(path, path, zmin.ProcessingMode.ECO)
+            with open(path) as f:
+                if f.read() != '{"a":[1,2,3]}':
+                    print("✗ Unexpected ECO file output")
+                    return False
+            
+            with open(path, "w") as f:
+                f.write('{"invalid": json}')
+            output_path = os.path.join(tmp_dir, "out.json")
+            try:
+                zmin.minify_file(path, output_path, zmin.ProcessingMode.ECO)
+                print("✗ Should have raised an error for invalid JSON")
+                return False
+            except zmin.ZminError:
+                pass
+            if os.listdir(tmp_dir) != ["data.json"]:
+                print(f"✗ Failed minification left files behind: {os.listdir(tmp_dir)}")
+                return False
+
+            # A symlinked output keeps the link and writes its target
+            with open(path, "w") as f:
+                f.write('[ 1 ]')
+            target_path = os.path.join(tmp_dir, "target.json")
+            with open(target_path, "w") as f:
+                f.write('[]')
+            os.symlink(target_path, output_path)
+            zmin.minify_file(path, output_path, zmin.ProcessingMode.ECO)
+            with open(target_path) as f:
+                if not os.path.islink(output_path) or f.read() != '[1]':
+                    print("✗ Symlinked ECO output was not written through the link")
+                    return False
+
+        print("✓ File minification successful")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Test failed: {e}")
+        return False
+
+def test_cli_input():
+    """Test reading CLI input from files and pipes"""
+    print("\nTesting CLI input...")
+    
+    try:
+        import tempfile
+        from zmin.cli import read_input, is_blank
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "data.json")
+            with open(path, "wb") as f:
+                f.write(b'{ "a" : 1 }')
+            data = read_input(path)
+            if bytes(data) != b'{ "a" : 1 }' or is_blank(data):
+                print(f"✗ Unexpected file input: {bytes(data)}")
+                return False
+            
+            empty_path = os.path.join(tmp_dir, "empty.json")
+            open(empty_path, "wb").close()
+            if read_input(empty_path) != b"":
+                print("✗ Empty file should read as empty bytes")
+                return False
+            
+            # Pipes cannot be memory-mapped and must be read instead
+            if os.path.isdir("/dev/fd"):
+                read_fd, write_fd = os.pipe()
+                os.write(write_fd, b'[1]')
+                os.close(write_fd)
+                try:
+                    if read_input(f"/dev/fd/{read_fd}") != b'[1]':
+                        print("✗ Unexpected pipe input")
+                        return False
+                finally:
+                    os.close(read_fd)
+        
+        if not is_blank(b"") or not is_blank(b" \n\t" * 50000) or is_blank(b" " * 70000 + b"1"):
+            print("✗ Unexpected is_blank result")
+            return False
+        
+        print("✓ CLI input successful")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Test failed: {e}")
+        return False
+
+def test_parse_args():
+    """Test the CLI's fast argument parser"""
+    print("\nTesting CLI argument parsing...")
+    
+    try:
+        from zmin.cli import parse_args
+        
+        args = parse_args(["in.json", "out.json", "--mode=eco", "-p", "-i", "4"])
+        if (args.input, args.output, args.mode, args.pretty, args.indent) != ("in.json", "out.json", "eco", True, 4):
+            print(f"✗ Unexpected parsed arguments: {args}")
+            return False
+        
+        args = parse_args([])
+        if (args.input, args.output, args.mode, args.pretty) != (None, None, "sport", False):
+            print(f"✗ Unexpected defaults: {args}")
+            return False
+        
+        # Left to argparse: a missing value, "=" on a short option, an
+        # unknown mode, too many positional arguments, and --help
+        for argv in (["-m"], ["-m=eco"], ["--mode", "fast"], ["a", "b", "c"], ["--help"]):
+            if parse_args(argv) is not None:
+                print(f"✗ Should have fallen back to argparse for {argv}")
+                return False
+        
+        print("✓ CLI argument parsing successful")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Test failed: {e}")
+        return False
+
+def test_threads():
+    """Test minification from multiple threads"""
+    print("\nTesting multi-threaded minification...")
+    
+    try:
+        test_json = '{ "items" : [' + ', '.join(str(i) for i in range(10000)) + '] }'
+        expected = zmin.minify(test_json)
+        
+        # The native call releases the GIL, so these run in parallel
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(zmin.minify, [test_json] * 16))
+        
+        if any(result != expected for result in results):
+            print("✗ Threaded results differ from single-threaded result")
+            return False
+        
+        print(f"✓ Multi-threaded minification successful: {len(results)} calls")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Test failed: {e}")
+        return False
+
 def test_version():
     """Test version information"""
     print("\nTesting version information...")
@@ -88,7 +337,14 @@ def main():
     
     tests = [
         test_basic_functionality,
+        test_backend,
         test_error_handling,
+        test_batch,
+        test_reformat,
+        test_minify_file,
+        test_cli_input,
+        test_parse_args,
+        test_threads,
         test_version,
     ]
     
@@ -3,27 +3,39 @@ zmin - High-performance JSON minifier for Python
 
 This package provides Python bindings for the zmin high-performance JSON minifier
 using ctypes to interface with the compiled shared library.
+
+The bindings are imported on first attribute access (PEP 562), so
+`import zmin` alone does not load ctypes or the shared library.
 """
 
-from ..zmin import (
-    Zmin,
-    ZminError,
-    ProcessingMode,
-    minify,
-    validate,
-    minify_file,
-    validate_file,
-    get_default_instance,
-    get_version,
-    eco,
-    sport,
-    turbo,
-    minify_async,
-    validate_async,
-    eco_async,
-    sport_async,
-    turbo_async,
-)
+# Spelled out instead of importing typing, which would slow down `import zmin`;
+# type checkers treat the name as true
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .zmin import (
+        Zmin,
+        ZminError,
+        ProcessingMode,
+        minify,
+        minify_bytes,
+        minify_many,
+        reformat,
+        validate,
+        validate_bytes,
+        minify_file,
+        validate_file,
+        get_default_instance,
+        get_version,
+        eco,
+        sport,
+        turbo,
+        minify_async,
+        validate_async,
+        eco_async,
+        sport_async,
+        turbo_async,
+        format_json,
+    )
 
 __version__ = "1.0.0"
 __author__ = "zmin contributors"
@@ -35,7 +47,11 @@ __all__ = [
     "ZminError", 
     "ProcessingMode",
     "minify",
+    "minify_bytes",
+    "minify_many",
+    "reformat",
     "validate",
+    "validate_bytes",
     "minify_file",
     "validate_file",
     "get_default_instance",
@@ -48,4 +64,20 @@ __all__ = [
     "eco_async",
     "sport_async",
     "turbo_async",
-] 
\ No newline at end of file
+    "format_json",
+]
+
+
+def __getattr__(name: str):
+    """Load the bindings module on first access to one of its names"""
+    if name in __all__:
+        from . import zmin as _bindings
+        value = getattr(_bindings, name)
+        # Cache on the package so later lookups skip this hook
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
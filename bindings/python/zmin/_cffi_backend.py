@@ -0,0 +1,99 @@
+"""
+CFFI backend for the zmin bindings
+
+ctypes calls are slow on PyPy, whose JIT compiles CFFI calls instead, so
+zmin.py prefers this module there. It provides the same functions as the
+Cython extension (zmin._core). The ffi modules it uses are generated by
+build_cffi.py: the compiled API-mode extension (zmin._fast_minify) when a
+compiler was available at install, else the ABI-mode module. Importing
+this module fails with ImportError when neither was built or cffi is
+missing.
+"""
+
+try:
+    # Linked against the default library and calls it without libffi
+    from ._fast_minify import ffi, lib as _lib
+    API_MODE = True
+    _lib.zmin_init()
+except ImportError:
+    # Opens the library on first use (see _load)
+    from ._cffi_ext import ffi
+    API_MODE = False
+    _lib = None
+
+
+class NativeError(Exception):
+    """Error reported by the native library"""
+    pass
+
+
+def _load():
+    """Open and initialize the default shared library"""
+    global _lib
+    # Imported here: zmin.zmin imports this module while it is initializing
+    from .zmin import _find_library
+
+    lib = ffi.dlopen(_find_library())
+    lib.zmin_init()
+    _lib = lib
+    return lib
+
+
+def _error_message(lib, error_code: int) -> str:
+    message = lib.zmin_get_error_message(error_code)
+    return ffi.string(message).decode('utf-8') if message != ffi.NULL else "Unknown error"
+
+
+def _for_input(index: int) -> str:
+    """Error message qualifier naming the failed input of a batch"""
+    return f" for input {index}" if index >= 0 else ""
+
+
+def _minify(input, input_size: int, mode: int, index: int = -1) -> bytes:
+    lib = _lib or _load()
+    result = lib.zmin_minify_mode(input, input_size, mode)
+
+    try:
+        if result.error_code != 0:
+            raise NativeError(f"Minification failed{_for_input(index)}: {_error_message(lib, result.error_code)}")
+        if result.data == ffi.NULL:
+            raise NativeError(f"Minification returned null data{_for_input(index)}")
+        return ffi.unpack(result.data, result.size)
+    finally:
+        lib.zmin_free_result_data(result.data, result.size)
+
+
+def minify(data: bytes, mode: int) -> bytes:
+    """Minify UTF-8 encoded JSON, returning the minified bytes"""
+    return _minify(data, len(data), mode)
+
+
+def minify_buffer(data, mode: int) -> bytes:
+    """Minify JSON held in any contiguous buffer (bytearray, mmap, ...) without copying it"""
+    return _minify(ffi.from_buffer(data), len(data), mode)
+
+
+def minify_many(inputs, mode: int) -> list:
+    """Minify a sequence of UTF-8 encoded JSON documents"""
+    return [_minify(data, len(data), mode, i) for i, data in enumerate(inputs)]
+
+
+def _validate(input, input_size: int) -> bool:
+    lib = _lib or _load()
+    return lib.zmin_validate(input, input_size) == 0
+
+
+def validate(data: bytes) -> bool:
+    """Validate UTF-8 encoded JSON"""
+    return _validate(data, len(data))
+
+
+def validate_buffer(data) -> bool:
+    """Validate JSON held in any contiguous buffer without copying it"""
+    return _validate(ffi.from_buffer(data), len(data))
+
+
+def validate_str(data: str) -> bool:
+    """Validate a JSON string"""
+    encoded = data.encode('utf-8')
+    return _validate(encoded, len(encoded))
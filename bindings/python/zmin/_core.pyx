@@ -0,0 +1,153 @@
+# cython: language_level=3
+"""
+Compiled fast path for the zmin bindings
+
+Calls the zmin C API directly instead of going through ctypes, which
+re-marshals arguments and unpacks the ZminResult struct on every call.
+zmin.py falls back to ctypes when this extension is not built.
+
+The GIL is released around the native calls, so minify/validate run in
+parallel when called from multiple threads.
+"""
+
+from cpython.bytes cimport PyBytes_FromStringAndSize
+from cpython.object cimport PyObject
+from cpython.ref cimport Py_DECREF, Py_XDECREF
+
+
+cdef extern from "Python.h":
+    # Raw-pointer variants so the output object can be resized in place
+    PyObject* _new_bytes "PyBytes_FromStringAndSize"(const char* v, Py_ssize_t size) except NULL
+    char* _bytes_data "PyBytes_AS_STRING"(PyObject* obj)
+    int _resize_bytes "_PyBytes_Resize"(PyObject** obj, Py_ssize_t size) except -1
+    const char* PyUnicode_AsUTF8AndSize(object s, Py_ssize_t* size) except NULL
+
+
+cdef extern from "zmin.h" nogil:
+    ctypedef struct ZminResult:
+        char* data
+        size_t size
+        int error_code
+
+    void zmin_init()
+    ZminResult zmin_minify_mode(const char* input, size_t input_size, int mode)
+    int zmin_minify_into(const char* input, size_t input_size, int mode,
+                         char* output, size_t output_capacity, size_t* output_size)
+    int zmin_validate(const char* input, size_t input_size)
+    void zmin_free_result(ZminResult* result)
+    const char* zmin_get_error_message(int error_code)
+
+
+class NativeError(Exception):
+    """Error reported by the native library"""
+    pass
+
+
+cdef str _error_message(int error_code):
+    cdef const char* message = zmin_get_error_message(error_code)
+    return message.decode('utf-8') if message != NULL else "Unknown error"
+
+
+cdef str _for_input(Py_ssize_t index):
+    """Error message qualifier naming the failed input of a batch"""
+    return f" for input {index}" if index >= 0 else ""
+
+
+def minify(bytes data, int mode):
+    """Minify UTF-8 encoded JSON, returning the minified bytes"""
+    return _minify(data, len(data), mode)
+
+
+def minify_buffer(const unsigned char[::1] data, int mode):
+    """Minify JSON held in any contiguous buffer (bytearray, mmap, ...) without copying it"""
+    cdef const char* input = ""
+    if data.shape[0] > 0:
+        input = <const char*>&data[0]
+    return _minify(input, data.shape[0], mode)
+
+
+cdef bytes _minify(const char* input, size_t input_size, int mode, Py_ssize_t index=-1):
+    cdef size_t size = 0
+    # One spare byte keeps the allocation distinct from the shared empty and
+    # single-character bytes objects, which must not be written to
+    cdef Py_ssize_t capacity = input_size + 1
+    cdef PyObject* out = _new_bytes(NULL, capacity)
+    cdef char* buffer = _bytes_data(out)
+    cdef int error_code
+    cdef bytes output
+
+    with nogil:
+        error_code = zmin_minify_into(input, input_size, mode, buffer, capacity, &size)
+
+    if error_code == -4:
+        Py_XDECREF(out)
+        return _minify_alloc(input, input_size, mode, index)
+    if error_code != 0:
+        Py_XDECREF(out)
+        raise NativeError(f"Minification failed{_for_input(index)}: {_error_message(error_code)}")
+
+    _resize_bytes(&out, size)
+    output = <bytes>out
+    Py_DECREF(output)
+    return output
+
+
+def minify_many(inputs, int mode):
+    """Minify a sequence of UTF-8 encoded JSON documents"""
+    cdef list outputs = []
+    cdef Py_ssize_t i
+    cdef bytes data
+
+    for i, data in enumerate(inputs):
+        outputs.append(_minify(data, len(data), mode, i))
+    return outputs
+
+
+cdef bytes _minify_alloc(const char* input, size_t input_size, int mode, Py_ssize_t index):
+    """Minify through the library-allocated result path"""
+    cdef ZminResult result
+
+    with nogil:
+        result = zmin_minify_mode(input, input_size, mode)
+
+    try:
+        if result.error_code != 0:
+            raise NativeError(f"Minification failed{_for_input(index)}: {_error_message(result.error_code)}")
+        if result.data == NULL:
+            raise NativeError(f"Minification returned null data{_for_input(index)}")
+        return PyBytes_FromStringAndSize(result.data, result.size)
+    finally:
+        zmin_free_result(&result)
+
+
+def validate(bytes data):
+    """Validate UTF-8 encoded JSON"""
+    return _validate(data, len(data))
+
+
+def validate_buffer(const unsigned char[::1] data):
+    """Validate JSON held in any contiguous buffer without copying it"""
+    cdef const char* input = ""
+    if data.shape[0] > 0:
+        input = <const char*>&data[0]
+    return _validate(input, data.shape[0])
+
+
+def validate_str(str data):
+    """Validate a JSON string through its UTF-8 representation"""
+    # Zero-copy for ASCII strings; otherwise CPython builds the UTF-8 form
+    # once and caches it on the string object
+    cdef Py_ssize_t size = 0
+    cdef const char* input = PyUnicode_AsUTF8AndSize(data, &size)
+    return _validate(input, size)
+
+
+cdef bint _validate(const char* input, size_t input_size):
+    cdef int error_code
+
+    with nogil:
+        error_code = zmin_validate(input, input_size)
+    return error_code == 0
+
+
+zmin_init()
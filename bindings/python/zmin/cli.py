@@ -3,18 +3,43 @@
 zmin CLI - Ultra-high-performance JSON minifier command-line interface
 """
 
-import argparse
-import json
+from __future__ import annotations
+
+import mmap
+import os
+import stat
 import sys
 import time
-from pathlib import Path
-from typing import Optional
-
-from ..zmin import minify, validate, format_json, ZminError
-
-
-def create_parser() -> argparse.ArgumentParser:
+from types import SimpleNamespace
+
+from .zmin import reformat, validate_bytes, ProcessingMode, ZminError
+
+# For type checkers only; see zmin.py
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import List, Optional, Union
+
+# Boolean flags and value options understood by parse_args; anything else
+# (--help, --version, typos, bad values) is left to the argparse parser
+_FLAGS = {
+    "-p": "pretty", "--pretty": "pretty",
+    "--sort-keys": "sort_keys",
+    "-v": "validate", "--validate": "validate",
+    "-q": "quiet", "--quiet": "quiet",
+    "--stats": "stats",
+}
+_OPTIONS = {
+    "-m": "mode", "--mode": "mode",
+    "-i": "indent", "--indent": "indent",
+}
+_MODES = ("eco", "sport", "turbo")
+
+
+def create_parser():
     """Create and configure the argument parser."""
+    # Imported here: argparse alone costs more than the rest of a typical run
+    import argparse
+
     parser = argparse.ArgumentParser(
         prog="zmin",
         description="Ultra-high-performance JSON minifier with 3.5+ GB/s throughput",
@@ -103,32 +128,105 @@ Performance modes:
     return parser
 
 
-def read_input(input_path: Optional[str]) -> str:
-    """Read input from file or stdin."""
+def parse_args(argv: List[str]) -> Optional[SimpleNamespace]:
+    """
+    Parse the common command lines without building the argparse parser.
+    
+    Returns None when argv needs argparse: help, version, or anything that
+    is not a plain use of the options above, so that argparse produces the
+    usual output and error messages.
+    """
+    args = SimpleNamespace(
+        input=None, output=None, mode="sport", pretty=False, indent=2,
+        sort_keys=False, validate=False, quiet=False, stats=False
+    )
+    positional = []
+    argv = iter(argv)
+
+    for arg in argv:
+        if arg == "-" or not arg.startswith("-"):
+            positional.append(arg)
+            continue
+
+        if arg in _FLAGS:
+            setattr(args, _FLAGS[arg], True)
+            continue
+
+        name, sep, value = arg.partition("=")
+        if name not in _OPTIONS or (sep and not name.startswith("--")):
+            return None
+        if not sep:
+            value = next(argv, None)
+            if value is None:
+                return None
+
+        if _OPTIONS[name] == "mode":
+            if value not in _MODES:
+                return None
+            args.mode = value
+        else:
+            try:
+                args.indent = int(value)
+            except ValueError:
+                return None
+
+    if len(positional) > 2:
+        return None
+    if positional:
+        args.input = positional[0]
+    if len(positional) > 1:
+        args.output = positional[1]
+    return args
+
+
+def is_blank(data: Union[bytes, mmap.mmap]) -> bool:
+    """Check whether input is empty or whitespace only, a chunk at a time."""
+    for start in range(0, len(data), 65536):
+        if data[start:start + 65536].strip():
+            return False
+    return True
+
+
+def read_input(input_path: Optional[str]) -> Union[bytes, mmap.mmap]:
+    """
+    Read raw input bytes from file or stdin.
+    
+    Files are memory-mapped rather than read, so the input is never copied
+    into a Python object; the mapping is passed straight to the minifier.
+    """
     if input_path:
         if input_path == "-":
-            return sys.stdin.read()
+            return sys.stdin.buffer.read()
         
-        path = Path(input_path)
-        if not path.exists():
-            raise FileNotFoundError(f"Input file '{input_path}' not found")
+        try:
+            f = open(input_path, "rb")
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Input file '{input_path}' not found") from None
         
-        return path.read_text(encoding="utf-8")
+        with f:
+            # Only non-empty regular files can be mapped; pipes and devices
+            # (e.g. /dev/stdin or a process substitution) are read instead
+            st = os.fstat(f.fileno())
+            if not stat.S_ISREG(st.st_mode) or st.st_size == 0:
+                return f.read()
+            # Copy-on-write mapping: writable, so ctypes can wrap it in place
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
     else:
         # Read from stdin
         if sys.stdin.isatty():
             raise ValueError("No input file specified and stdin is empty")
-        return sys.stdin.read()
+        return sys.stdin.buffer.read()
 
 
-def write_output(output_path: Optional[str], content: str) -> None:
-    """Write output to file or stdout."""
+def write_output(output_path: Optional[str], content: bytes) -> None:
+    """Write output bytes to file or stdout."""
     if output_path and output_path != "-":
-        Path(output_path).write_text(content, encoding="utf-8")
+        with open(output_path, "wb") as f:
+            f.write(content)
     else:
-        sys.stdout.write(content)
-        if not content.endswith("\n"):
-            sys.stdout.write("\n")
+        sys.stdout.buffer.write(content)
+        if not content.endswith(b"\n"):
+            sys.stdout.buffer.write(b"\n")
 
 
 def format_size(size_bytes: int) -> str:
@@ -162,46 +260,50 @@ def calculate_throughput(size_bytes: int, duration_seconds: float) -> str:
 
 
 def process_json(
-    input_text: str,
+    input_data: Union[bytes, mmap.mmap],
     mode: str,
     pretty: bool = False,
     indent: int = 2,
     sort_keys: bool = False,
     validate_only: bool = False
-) -> str:
+) -> bytes:
     """Process JSON according to the specified options."""
     if validate_only:
-        is_valid = validate(input_text)
-        return "✅ Valid JSON" if is_valid else "❌ Invalid JSON"
+        is_valid = validate_bytes(input_data)
+        return ("✅ Valid JSON" if is_valid else "❌ Invalid JSON").encode("utf-8")
     
-    if pretty:
-        return format_json(input_text, indent=indent, sort_keys=sort_keys)
-    else:
-        return minify(input_text, mode=mode)
+    return reformat(
+        input_data,
+        mode=ProcessingMode.from_str(mode),
+        pretty=pretty,
+        indent=indent,
+        sort_keys=sort_keys
+    )
 
 
 def main() -> None:
     """Main CLI entry point."""
-    parser = create_parser()
-    args = parser.parse_args()
+    args = parse_args(sys.argv[1:])
+    if args is None:
+        args = create_parser().parse_args()
 
     try:
         # Read input
         start_time = time.time()
-        input_text = read_input(args.input)
+        input_data = read_input(args.input)
         read_time = time.time() - start_time
 
-        if not input_text.strip():
+        if is_blank(input_data):
             print("Error: Input is empty", file=sys.stderr)
             sys.exit(1)
 
-        input_size = len(input_text.encode("utf-8"))
+        input_size = len(input_data)
 
         # Process JSON
         process_start = time.time()
         try:
             result = process_json(
-                input_text,
+                input_data,
                 mode=args.mode,
                 pretty=args.pretty,
                 indent=args.indent,
@@ -211,7 +313,8 @@ def main() -> None:
         except ZminError as e:
             print(f"Error: {e}", file=sys.stderr)
             sys.exit(1)
-        except json.JSONDecodeError as e:
+        except ValueError as e:
+            # json.JSONDecodeError from --sort-keys; json itself is not imported here
             print(f"JSON Error: {e}", file=sys.stderr)
             sys.exit(1)
         
@@ -226,7 +329,7 @@ def main() -> None:
 
         # Show statistics if requested
         if not args.quiet and args.output and args.output != "-":
-            output_size = len(result.encode("utf-8"))
+            output_size = len(result)
             
             if not args.validate:
                 reduction = ((input_size - output_size) / input_size * 100) if input_size > 0 else 0
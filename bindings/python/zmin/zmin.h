@@ -0,0 +1,49 @@
+/*
+ * C API declarations for the zmin shared library.
+ *
+ * Mirrors src/bindings/c_api.zig; used by the compiled Python extension.
+ */
+
+#ifndef ZMIN_H
+#define ZMIN_H
+
+#include <stddef.h>
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Result structure from C API */
+typedef struct {
+    char* data;
+    size_t size;
+    int error_code;
+} ZminResult;
+
+void zmin_init(void);
+const char* zmin_get_version(void);
+ZminResult zmin_minify(const char* input, size_t input_size);
+ZminResult zmin_minify_mode(const char* input, size_t input_size, int mode);
+int zmin_minify_into(const char* input, size_t input_size, int mode,
+                     char* output, size_t output_capacity, size_t* output_size);
+void zmin_minify_batch(const char* const* inputs, const size_t* input_sizes,
+                       size_t count, int mode, ZminResult* outputs);
+void zmin_minify_batch_soa(const char* const* inputs, const size_t* input_sizes,
+                           size_t count, int mode, char** output_data,
+                           size_t* output_sizes, int* output_errors);
+int zmin_minify_stream(int input_fd, int output_fd);
+ZminResult zmin_reformat(const char* input, size_t input_size, int mode,
+                         int pretty, int indent);
+int zmin_validate(const char* input, size_t input_size);
+void zmin_free_result(ZminResult* result);
+void zmin_free_result_data(char* data, size_t size);
+void zmin_free_batch(ZminResult* results, size_t count);
+void zmin_free_batch_soa(char** output_data, size_t* output_sizes, size_t count);
+const char* zmin_get_error_message(int error_code);
+size_t zmin_estimate_output_size(size_t input_size);
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif /* ZMIN_H */
@@ -0,0 +1,837 @@
+"""
+Python bindings for zmin JSON minifier
+
+This module provides Python bindings for the zmin high-performance JSON minifier
+using ctypes to interface with the compiled shared library. When the optional
+Cython extension (zmin._core) is built, or on PyPy the CFFI backend
+(zmin._cffi_backend), minify/validate call into it instead.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import mmap
+import os
+import sys
+
+# typing is only imported for type checkers: it pulls in re and costs more
+# than the rest of this module's imports. As in __init__.py, the name is
+# spelled out; type checkers treat it as true.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Dict, List, Optional, Sequence, Union
+
+    # Input accepted by the bytes APIs
+    BytesLike = Union[bytes, bytearray, memoryview, mmap.mmap]
+
+# Native backend used instead of ctypes when available: the CFFI module on
+# PyPy (where ctypes calls are slow), else the compiled Cython extension,
+# else the CFFI module if its compiled (API mode) variant was built
+_core = None
+if sys.implementation.name == "pypy":
+    try:
+        from . import _cffi_backend as _core
+    except ImportError:
+        pass
+if _core is None:
+    try:
+        from . import _core
+    except ImportError:
+        _core = None
+if _core is None:
+    try:
+        from . import _cffi_backend
+        if _cffi_backend.API_MODE:
+            _core = _cffi_backend
+    except ImportError:
+        pass
+
+
+class ProcessingMode:
+    """
+    JSON processing modes
+    
+    The modes are plain ints rather than an IntEnum, so they are passed to the
+    native library as-is with no conversion on each call.
+    """
+    ECO = 0    # Memory-efficient mode (64KB limit)
+    SPORT = 1  # Balanced mode (default)
+    TURBO = 2  # Maximum performance mode
+    
+    @classmethod
+    def from_str(cls, name: str) -> int:
+        """Look up a mode by name ("eco", "sport" or "turbo", case-insensitive)"""
+        mode = {"eco": cls.ECO, "sport": cls.SPORT, "turbo": cls.TURBO}.get(name.lower())
+        if mode is None:
+            raise ValueError(f"Unknown processing mode: {name}")
+        return mode
+
+
+class ZminError(Exception):
+    """Base exception for zmin errors"""
+    pass
+
+
+# C API structures
+class ZminResult(ctypes.Structure):
+    """Result structure for C API calls."""
+    # c_void_p rather than c_char_p so reading the field does not copy the data
+    _fields_ = [
+        ("data", ctypes.c_void_p),
+        ("size", ctypes.c_size_t),
+        ("error_code", ctypes.c_int),
+    ]
+
+
+def _setup_functions(lib: ctypes.CDLL):
+    """Setup ctypes function signatures"""
+    # zmin_init
+    lib.zmin_init.argtypes = []
+    lib.zmin_init.restype = None
+    
+    # zmin_minify
+    lib.zmin_minify.argtypes = [ctypes.c_char_p, ctypes.c_size_t]
+    lib.zmin_minify.restype = ZminResult
+    
+    # zmin_minify_mode
+    lib.zmin_minify_mode.argtypes = [ctypes.c_char_p, ctypes.c_size_t, ctypes.c_int]
+    lib.zmin_minify_mode.restype = ZminResult
+    
+    # zmin_minify_stream
+    lib.zmin_minify_stream.argtypes = [ctypes.c_int, ctypes.c_int]
+    lib.zmin_minify_stream.restype = ctypes.c_int
+    
+    # zmin_reformat
+    lib.zmin_reformat.argtypes = [ctypes.c_char_p, ctypes.c_size_t, ctypes.c_int, ctypes.c_int, ctypes.c_int]
+    lib.zmin_reformat.restype = ZminResult
+    
+    # zmin_validate
+    lib.zmin_validate.argtypes = [ctypes.c_char_p, ctypes.c_size_t]
+    lib.zmin_validate.restype = ctypes.c_int
+    
+    # zmin_minify_batch
+    lib.zmin_minify_batch.argtypes = [
+        ctypes.POINTER(ctypes.c_char_p), ctypes.POINTER(ctypes.c_size_t), ctypes.c_size_t,
+        ctypes.c_int, ctypes.POINTER(ZminResult),
+    ]
+    lib.zmin_minify_batch.restype = None
+    
+    # zmin_minify_batch_soa
+    lib.zmin_minify_batch_soa.argtypes = [
+        ctypes.POINTER(ctypes.c_char_p), ctypes.POINTER(ctypes.c_size_t), ctypes.c_size_t, ctypes.c_int,
+        ctypes.POINTER(ctypes.c_void_p), ctypes.POINTER(ctypes.c_size_t), ctypes.POINTER(ctypes.c_int),
+    ]
+    lib.zmin_minify_batch_soa.restype = None
+    
+    # zmin_free_result
+    lib.zmin_free_result.argtypes = [ctypes.POINTER(ZminResult)]
+    lib.zmin_free_result.restype = None
+    
+    # zmin_free_result_data
+    lib.zmin_free_result_data.argtypes = [ctypes.c_void_p, ctypes.c_size_t]
+    lib.zmin_free_result_data.restype = None
+    
+    # zmin_free_batch
+    lib.zmin_free_batch.argtypes = [ctypes.POINTER(ZminResult), ctypes.c_size_t]
+    lib.zmin_free_batch.restype = None
+    
+    # zmin_free_batch_soa
+    lib.zmin_free_batch_soa.argtypes = [ctypes.POINTER(ctypes.c_void_p), ctypes.POINTER(ctypes.c_size_t), ctypes.c_size_t]
+    lib.zmin_free_batch_soa.restype = None
+    
+    # zmin_get_version
+    lib.zmin_get_version.argtypes = []
+    lib.zmin_get_version.restype = ctypes.c_char_p
+    
+    # zmin_get_error_message
+    lib.zmin_get_error_message.argtypes = [ctypes.c_int]
+    lib.zmin_get_error_message.restype = ctypes.c_char_p
+    
+    # zmin_estimate_output_size
+    lib.zmin_estimate_output_size.argtypes = [ctypes.c_size_t]
+    lib.zmin_estimate_output_size.restype = ctypes.c_size_t
+
+
+def _as_c_buffer(data: BytesLike):
+    """Wrap a bytes-like object for a c_char_p argument, avoiding a copy where possible"""
+    if type(data) is bytes:
+        return data
+    try:
+        return (ctypes.c_char * len(data)).from_buffer(data)
+    except TypeError:
+        # Read-only buffers cannot be wrapped in place
+        return bytes(data)
+
+
+# Loaded libraries keyed by path, with function signatures already set up
+_loaded_libs: Dict[str, ctypes.CDLL] = {}
+
+
+def _load_library(lib_path: str) -> ctypes.CDLL:
+    """Load a zmin shared library, setting up its signatures only once"""
+    lib = _loaded_libs.get(lib_path)
+    if lib is None:
+        lib = ctypes.CDLL(lib_path)
+        _setup_functions(lib)
+        _loaded_libs[lib_path] = lib
+    return lib
+
+
+# Library configured through the ZMIN_LIB environment variable, read at import
+_env_lib_path: Optional[str] = os.environ.get("ZMIN_LIB") or None
+
+# Cached result of _find_library, seeded from ZMIN_LIB so an explicitly
+# configured library needs no search at all
+_lib_path: Optional[str] = _env_lib_path
+
+
+def _find_library() -> str:
+    """
+    Find the zmin shared library
+    
+    Uses the ZMIN_LIB environment variable (read at import), then the library
+    shipped inside the package, then the system search path. The result is
+    cached.
+    """
+    global _lib_path
+    if _lib_path is not None:
+        return _lib_path
+    
+    if sys.platform == "win32":
+        lib_name = "zmin.dll"
+    elif sys.platform == "darwin":
+        lib_name = "libzmin.dylib"
+    else:
+        lib_name = "libzmin.so"
+    
+    bundled = os.path.join(os.path.dirname(os.path.abspath(__file__)), lib_name)
+    if os.path.exists(bundled):
+        lib_path = bundled
+    else:
+        from ctypes.util import find_library
+        lib_path = find_library("zmin")
+    
+    if not lib_path:
+        raise ZminError("Could not find zmin library. Set ZMIN_LIB or specify lib_path.")
+    
+    _lib_path = lib_path
+    return lib_path
+
+
+class Zmin:
+    """Python wrapper for zmin JSON minifier"""
+    
+    def __init__(self, lib_path: Optional[str] = None):
+        """
+        Initialize zmin wrapper
+        
+        The shared library is located and loaded on first use rather than here.
+        
+        The compiled backends are linked against the library bundled with
+        the package, so they are only used when no other library is
+        requested through lib_path or ZMIN_LIB; all calls then go through
+        ctypes with the requested library.
+        
+        Args:
+            lib_path: Path to zmin shared library. If None, will search standard locations.
+        """
+        self._lib_path = lib_path
+        self._lib: Optional[ctypes.CDLL] = None
+        
+        self._core = _core if lib_path is None and _env_lib_path is None else None
+    
+    def _load(self) -> ctypes.CDLL:
+        """Load and initialize the shared library"""
+        lib = _load_library(self._lib_path or _find_library())
+        
+        # Bind the hot-path functions once so calls skip the CDLL lookup
+        self._c_minify_mode = lib.zmin_minify_mode
+        self._c_validate = lib.zmin_validate
+        self._c_free_result_data = lib.zmin_free_result_data
+        self._c_minify_batch_soa = lib.zmin_minify_batch_soa
+        self._c_free_batch_soa = lib.zmin_free_batch_soa
+        
+        # Initialize the library
+        lib.zmin_init()
+        
+        self._lib = lib
+        return lib
+    
+    def minify(self, input_json: Union[str, dict, list], mode: int = ProcessingMode.SPORT) -> str:
+        """
+        Minify JSON data
+        
+        A dict or list is serialized directly in compact form with json.dumps,
+        which already is the minified output, so the native library is not
+        called and mode has no effect. Non-ASCII characters are kept as-is
+        rather than escaped.
+        
+        Args:
+            input_json: JSON string, dict, or list to minify
+            mode: Processing mode (ECO, SPORT, or TURBO)
+        
+        Returns:
+            Minified JSON string
+        
+        Raises:
+            ZminError: If minification fails
+        """
+        if isinstance(input_json, (dict, list)):
+            import json
+            return json.dumps(input_json, separators=(',', ':'), ensure_ascii=False)
+        
+        return self.minify_bytes(input_json.encode('utf-8'), mode).decode('utf-8')
+    
+    def minify_bytes(self, input_bytes: BytesLike, mode: int = ProcessingMode.SPORT) -> bytes:
+        """
+        Minify UTF-8 encoded JSON without converting to or from str
+        
+        Besides bytes, any bytes-like object (bytearray, memoryview, mmap) is
+        accepted and passed to the native library without copying it, as
+        long as it is writable or the compiled extension is available.
+        
+        Args:
+            input_bytes: UTF-8 encoded JSON
+            mode: Processing mode (ECO, SPORT, or TURBO)
+        
+        Returns:
+            Minified JSON as UTF-8 bytes
+        
+        Raises:
+            ZminError: If minification fails
+        """
+        if self._core is not None:
+            try:
+                if type(input_bytes) is bytes:
+                    return self._core.minify(input_bytes, mode)
+                return self._core.minify_buffer(input_bytes, mode)
+            except self._core.NativeError as e:
+                raise ZminError(str(e)) from None
+        
+        if self._lib is None:
+            self._load()
+        
+        return self._minify_raw(_as_c_buffer(input_bytes), len(input_bytes), mode)
+    
+    def _minify_raw(self, input_bytes: bytes, input_size: int, mode: int) -> bytes:
+        """
+        Minify through ctypes with pre-extracted arguments
+        
+        Does only the native call and result handling, for tight loops that
+        reuse the same mode. The library must already be loaded (see _load),
+        input_bytes must be bytes or a c_char array, and mode a plain int.
+        """
+        result = self._c_minify_mode(input_bytes, input_size, mode)
+        
+        try:
+            # Check for errors
+            if result.error_code != 0:
+                error_msg = self._lib.zmin_get_error_message(result.error_code)
+                error_str = error_msg.decode('utf-8') if error_msg else "Unknown error"
+                raise ZminError(f"Minification failed: {error_str}")
+            
+            # Extract output
+            if result.data:
+                return ctypes.string_at(result.data, result.size)
+            else:
+                raise ZminError("Minification returned null data")
+        finally:
+            # Free by pointer, without a byref() temporary per call
+            self._c_free_result_data(result.data, result.size)
+    
+    def minify_many(self, inputs: Sequence[bytes], mode: int = ProcessingMode.SPORT) -> List[bytes]:
+        """
+        Minify many UTF-8 encoded JSON documents
+        
+        The whole batch crosses into the native library in a single call, so
+        the per-call overhead is paid once rather than per document. Useful
+        for many small documents.
+        
+        Args:
+            inputs: UTF-8 encoded JSON documents
+            mode: Processing mode (ECO, SPORT, or TURBO)
+        
+        Returns:
+            Minified documents, in input order
+        
+        Raises:
+            ZminError: If minification of any document fails
+        """
+        if self._core is not None:
+            try:
+                return self._core.minify_many(inputs, mode)
+            except self._core.NativeError as e:
+                raise ZminError(str(e)) from None
+        
+        if self._lib is None:
+            self._load()
+        
+        count = len(inputs)
+        input_array = (ctypes.c_char_p * count)(*inputs)
+        size_array = (ctypes.c_size_t * count)(*map(len, inputs))
+        
+        # Results come back as parallel arrays, each read in a single pass
+        output_data = (ctypes.c_void_p * count)()
+        output_sizes = (ctypes.c_size_t * count)()
+        output_errors = (ctypes.c_int * count)()
+        
+        self._c_minify_batch_soa(input_array, size_array, count, mode, output_data, output_sizes, output_errors)
+        
+        try:
+            if any(output_errors):
+                for i, error_code in enumerate(output_errors):
+                    if error_code != 0:
+                        error_msg = self._lib.zmin_get_error_message(error_code)
+                        error_str = error_msg.decode('utf-8') if error_msg else "Unknown error"
+                        raise ZminError(f"Minification failed for input {i}: {error_str}")
+            if not all(output_data):
+                raise ZminError(f"Minification returned null data for input {list(output_data).index(None)}")
+            
+            string_at = ctypes.string_at
+            return [string_at(data, size) for data, size in zip(output_data, output_sizes)]
+        finally:
+            self._c_free_batch_soa(output_data, output_sizes, count)
+    
+    def reformat(self, input_bytes: BytesLike, mode: int = ProcessingMode.SPORT, pretty: bool = False,
+                 indent: int = 2, sort_keys: bool = False) -> bytes:
+        """
+        Minify or pretty-print UTF-8 encoded JSON
+        
+        Pretty output is produced by the native library in a single pass and
+        matches json.dumps(..., indent=indent), except that non-ASCII
+        characters are kept as-is. Sorting keys needs the whole document in
+        memory, so with sort_keys the json module is used instead.
+        
+        Args:
+            input_bytes: UTF-8 encoded JSON (bytes, bytearray, memoryview or mmap)
+            mode: Processing mode for minified output
+            pretty: Pretty-print instead of minifying
+            indent: Indentation spaces per level (with pretty)
+            sort_keys: Sort object keys
+        
+        Returns:
+            Reformatted JSON bytes
+        
+        Raises:
+            ZminError: If the input cannot be reformatted
+        """
+        if sort_keys:
+            import json
+            parsed = json.loads(bytes(input_bytes))
+            if pretty:
+                output = json.dumps(parsed, indent=indent, sort_keys=True, ensure_ascii=False)
+            else:
+                output = json.dumps(parsed, separators=(',', ':'), sort_keys=True, ensure_ascii=False)
+            return output.encode('utf-8')
+        
+        if not pretty:
+            return self.minify_bytes(input_bytes, mode)
+        
+        lib = self._lib or self._load()
+        result = lib.zmin_reformat(_as_c_buffer(input_bytes), len(input_bytes), mode, 1, indent)
+        
+        try:
+            if result.error_code != 0:
+                error_msg = lib.zmin_get_error_message(result.error_code)
+                error_str = error_msg.decode('utf-8') if error_msg else "Unknown error"
+                raise ZminError(f"Formatting failed: {error_str}")
+            
+            if result.data:
+                return ctypes.string_at(result.data, result.size)
+            raise ZminError("Formatting returned null data")
+        finally:
+            self._c_free_result_data(result.data, result.size)
+    
+    def validate(self, input_json: Union[str, dict, list]) -> bool:
+        """
+        Validate JSON data
+        
+        A dict or list is always considered valid, since it can be serialized
+        to JSON; the native library is not called for it.
+        
+        Args:
+            input_json: JSON string, dict, or list to validate
+        
+        Returns:
+            True if valid JSON, False otherwise
+        """
+        if isinstance(input_json, (dict, list)):
+            return True
+        
+        if self._core is not None:
+            # Reads the string's cached UTF-8 form instead of encoding a copy
+            return self._core.validate_str(input_json)
+        
+        return self.validate_bytes(input_json.encode('utf-8'))
+    
+    def validate_bytes(self, input_bytes: BytesLike) -> bool:
+        """
+        Validate UTF-8 encoded JSON without converting from str
+        
+        Args:
+            input_bytes: UTF-8 encoded JSON (bytes, bytearray, memoryview or mmap)
+        
+        Returns:
+            True if valid JSON, False otherwise
+        """
+        if self._core is not None:
+            if type(input_bytes) is bytes:
+                return self._core.validate(input_bytes)
+            return self._core.validate_buffer(input_bytes)
+        
+        if self._lib is None:
+            self._load()
+        
+        error_code = self._c_validate(_as_c_buffer(input_bytes), len(input_bytes))
+        
+        return error_code == 0
+    
+    def get_version(self) -> str:
+        """Get zmin version string"""
+        lib = self._lib or self._load()
+        version = lib.zmin_get_version()
+        return version.decode('utf-8') if version else "unknown"
+    
+    def estimate_output_size(self, input_size: int) -> int:
+        """Estimate output size for given input size"""
+        lib = self._lib or self._load()
+        return lib.zmin_estimate_output_size(input_size)
+    
+    def minify_file(self, input_path: str, output_path: str, mode: int = ProcessingMode.SPORT):
+        """
+        Minify a JSON file
+        
+        In ECO mode the file is streamed through the native library in
+        fixed-size chunks, so memory use does not grow with the file size.
+        Other modes read the whole file into memory. Either way the output
+        file is only replaced once minification succeeds, so input_path and
+        output_path may be the same file.
+        
+        Args:
+            input_path: Path to input JSON file
+            output_path: Path to output file
+            mode: Processing mode
+        
+        Raises:
+            ZminError: If minification fails
+        """
+        if mode == ProcessingMode.ECO and os.name != 'nt':
+            lib = self._lib or self._load()
+            
+            # Streamed into a temporary file next to the output, which then
+            # replaces it: opening the output directly would truncate the
+            # input when both are the same file, and leave a partial output
+            # behind on error. A symlinked output is resolved first so that,
+            # as in the other modes, its target is written rather than the
+            # link replaced.
+            output_path = os.path.realpath(output_path)
+            tmp_path = f"{output_path}.{os.urandom(6).hex()}.tmp"
+            # Created with mode 0666 like open() does, so the umask applies
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+            try:
+                with os.fdopen(fd, 'wb') as fout, open(input_path, 'rb') as fin:
+                    error_code = lib.zmin_minify_stream(fin.fileno(), fout.fileno())
+                if error_code != 0:
+                    error_msg = lib.zmin_get_error_message(error_code)
+                    error_str = error_msg.decode('utf-8') if error_msg else "Unknown error"
+                    raise ZminError(f"Minification failed: {error_str}")
+                
+                # Keep the permissions of a file being replaced
+                try:
+                    os.chmod(tmp_path, os.stat(output_path).st_mode & 0o7777)
+                except FileNotFoundError:
+                    pass
+                os.replace(tmp_path, output_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            return
+        
+        with open(input_path, 'rb') as f:
+            input_bytes = f.read()
+        
+        output = self.minify_bytes(input_bytes, mode)
+        
+        with open(output_path, 'wb') as f:
+            f.write(output)
+    
+    def validate_file(self, file_path: str) -> bool:
+        """
+        Validate a JSON file
+        
+        Args:
+            file_path: Path to JSON file
+        
+        Returns:
+            True if valid JSON, False otherwise
+        """
+        with open(file_path, 'rb') as f:
+            input_bytes = f.read()
+        
+        return self.validate_bytes(input_bytes)
+    
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        pass
+
+
+# Global library instance
+_lib_instance: Optional[Zmin] = None
+
+
+def _get_lib() -> Zmin:
+    """Get the global library instance."""
+    global _lib_instance
+    if _lib_instance is None:
+        _lib_instance = Zmin()
+    return _lib_instance
+
+
+# Convenience functions
+def get_default_instance() -> Zmin:
+    """Get or create default zmin instance"""
+    return _get_lib()
+
+
+def minify(input_json: Union[str, dict, list], mode: int = ProcessingMode.SPORT) -> str:
+    """
+    Minify JSON data using default instance
+    
+    Args:
+        input_json: JSON string, dict, or list to minify
+        mode: Processing mode
+    
+    Returns:
+        Minified JSON string
+    """
+    return _get_lib().minify(input_json, mode)
+
+
+def minify_bytes(input_bytes: BytesLike, mode: int = ProcessingMode.SPORT) -> bytes:
+    """
+    Minify UTF-8 encoded JSON using default instance
+    
+    Args:
+        input_bytes: UTF-8 encoded JSON
+        mode: Processing mode
+    
+    Returns:
+        Minified JSON as UTF-8 bytes
+    """
+    return _get_lib().minify_bytes(input_bytes, mode)
+
+
+def minify_many(inputs: Sequence[bytes], mode: int = ProcessingMode.SPORT) -> List[bytes]:
+    """
+    Minify many UTF-8 encoded JSON documents using default instance
+    
+    Args:
+        inputs: UTF-8 encoded JSON documents
+        mode: Processing mode
+    
+    Returns:
+        Minified documents, in input order
+    """
+    return _get_lib().minify_many(inputs, mode)
+
+
+def reformat(input_bytes: BytesLike, mode: int = ProcessingMode.SPORT, pretty: bool = False,
+             indent: int = 2, sort_keys: bool = False) -> bytes:
+    """
+    Minify or pretty-print UTF-8 encoded JSON using default instance
+    
+    Args:
+        input_bytes: UTF-8 encoded JSON (bytes, bytearray, memoryview or mmap)
+        mode: Processing mode for minified output
+        pretty: Pretty-print instead of minifying
+        indent: Indentation spaces per level (with pretty)
+        sort_keys: Sort object keys
+    
+    Returns:
+        Reformatted JSON bytes
+    """
+    return _get_lib().reformat(input_bytes, mode, pretty, indent, sort_keys)
+
+
+def validate(input_json: Union[str, dict, list]) -> bool:
+    """
+    Validate JSON data using default instance
+    
+    Args:
+        input_json: JSON string, dict, or list to validate
+    
+    Returns:
+        True if valid JSON, False otherwise
+    """
+    return _get_lib().validate(input_json)
+
+
+def validate_bytes(input_bytes: BytesLike) -> bool:
+    """
+    Validate UTF-8 encoded JSON using default instance
+    
+    Args:
+        input_bytes: UTF-8 encoded JSON (bytes, bytearray, memoryview or mmap)
+    
+    Returns:
+        True if valid JSON, False otherwise
+    """
+    return _get_lib().validate_bytes(input_bytes)
+
+
+def minify_file(input_path: str, output_path: str, mode: int = ProcessingMode.SPORT):
+    """Minify a JSON file using default instance"""
+    _get_lib().minify_file(input_path, output_path, mode)
+
+
+def validate_file(file_path: str) -> bool:
+    """Validate a JSON file using default instance"""
+    return _get_lib().validate_file(file_path)
+
+
+def get_version() -> str:
+    """Get the zmin library version."""
+    return _get_lib().get_version()
+
+
+# Convenience functions for each mode
+def eco(input_json: Union[str, dict, list]) -> str:
+    """Minify using ECO mode."""
+    return minify(input_json, ProcessingMode.ECO)
+
+
+def sport(input_json: Union[str, dict, list]) -> str:
+    """Minify using SPORT mode."""
+    return minify(input_json, ProcessingMode.SPORT)
+
+
+def turbo(input_json: Union[str, dict, list]) -> str:
+    """Minify using TURBO mode."""
+    return minify(input_json, ProcessingMode.TURBO)
+
+
+# Async versions (for compatibility with Node.js bindings)
+async def minify_async(input_json: Union[str, dict, list], mode: int = ProcessingMode.SPORT) -> str:
+    """Minify JSON data asynchronously."""
+    # For now, just call the sync version
+    # In a real implementation, this would use asyncio to run in a thread pool
+    return minify(input_json, mode)
+
+
+async def validate_async(input_json: Union[str, dict, list]) -> bool:
+    """Validate JSON data asynchronously."""
+    # For now, just call the sync version
+    return validate(input_json)
+
+
+async def eco_async(input_json: Union[str, dict, list]) -> str:
+    """Minify using ECO mode asynchronously."""
+    return await minify_async(input_json, ProcessingMode.ECO)
+
+
+async def sport_async(input_json: Union[str, dict, list]) -> str:
+    """Minify using SPORT mode asynchronously."""
+    return await minify_async(input_json, ProcessingMode.SPORT)
+
+
+async def turbo_async(input_json: Union[str, dict, list]) -> str:
+    """Minify using TURBO mode asynchronously."""
+    return await minify_async(input_json, ProcessingMode.TURBO)
+
+
+def format_json(input_json: Union[str, dict, list], indent: int = 2, sort_keys: bool = False) -> str:
+    """Format JSON with pretty printing."""
+    import json
+    
+    if isinstance(input_json, str):
+        # Parse the JSON string first
+        parsed = json.loads(input_json)
+    else:
+        parsed = input_json
+    
+    return json.dumps(parsed, indent=indent, sort_keys=sort_keys, separators=(',', ': ') if indent else (',', ':'))
+
+
+# CLI interface
+def main():
+    """Command-line interface"""
+    import argparse
+    import time
+    
+    parser = argparse.ArgumentParser(description='zmin JSON minifier')
+    parser.add_argument('input', nargs='?', help='Input JSON file (default: stdin)')
+    parser.add_argument('output', nargs='?', help='Output file (default: stdout)')
+    parser.add_argument('-m', '--mode', choices=['eco', 'sport', 'turbo'], default='sport',
+                        help='Processing mode (default: sport)')
+    parser.add_argument('-v', '--validate', action='store_true',
+                        help='Validate only, do not minify')
+    parser.add_argument('--version', action='store_true',
+                        help='Show version and exit')
+    parser.add_argument('--stats', action='store_true',
+                        help='Show statistics')
+    
+    args = parser.parse_args()
+    
+    try:
+        zmin = Zmin()
+        
+        if args.version:
+            print(f"zmin version {zmin.get_version()}")
+            return
+        
+        # Read input
+        if args.input:
+            with open(args.input, 'rb') as f:
+                input_data = f.read()
+        else:
+            input_data = sys.stdin.buffer.read()
+        
+        # Validate only
+        if args.validate:
+            if zmin.validate_bytes(input_data):
+                print("Valid JSON", file=sys.stderr)
+                sys.exit(0)
+            else:
+                print("Invalid JSON", file=sys.stderr)
+                sys.exit(1)
+        
+        # Get mode
+        mode = ProcessingMode.from_str(args.mode)
+        
+        # Minify
+        start_time = time.time()
+        output = zmin.minify_bytes(input_data, mode)
+        elapsed = time.time() - start_time
+        
+        # Write output
+        if args.output:
+            with open(args.output, 'wb') as f:
+                f.write(output)
+        else:
+            sys.stdout.buffer.write(output)
+        
+        # Show stats
+        if args.stats:
+            input_size = len(input_data)
+            output_size = len(output)
+            reduction = (input_size - output_size) / input_size * 100
+            throughput = input_size / elapsed / 1024 / 1024
+            
+            print(f"\nStatistics:", file=sys.stderr)
+            print(f"  Input size:  {input_size:,} bytes", file=sys.stderr)
+            print(f"  Output size: {output_size:,} bytes", file=sys.stderr)
+            print(f"  Reduction:   {reduction:.1f}%", file=sys.stderr)
+            print(f"  Time:        {elapsed*1000:.2f} ms", file=sys.stderr)
+            print(f"  Throughput:  {throughput:.1f} MB/s", file=sys.stderr)
+    
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -3,6 +3,7 @@
 //! This module provides a C-compatible API for using zmin from other languages.
 
 const std = @import("std");
+const builtin = @import("builtin");
 const zmin = @import("../root.zig");
 
 /// Result structure for C API
@@ -12,8 +13,10 @@ pub const ZminResult = extern struct {
     error_code: c_int,
 };
 
-/// Thread-local allocator for C API
-threadlocal var c_allocator: ?std.mem.Allocator = null;
+/// Allocator for C API
+/// Process-wide (not thread-local) so that results can be produced and freed
+/// from any thread after a single zmin_init call; c_allocator is thread-safe.
+var c_allocator: ?std.mem.Allocator = null;
 
 /// Initialize the C API
 export fn zmin_init() void {
@@ -31,6 +34,26 @@ export fn zmin_minify(input: [*c]const u8, input_size: usize) ZminResult {
     return zmin_minify_mode(input, input_size, 1); // 1 = SPORT
 }
 
+/// Convert a C API mode value (0 = ECO, 1 = SPORT, 2 = TURBO)
+fn modeFromInt(mode: c_int) ?zmin.ProcessingMode {
+    return switch (mode) {
+        0 => zmin.ProcessingMode.eco,
+        1 => zmin.ProcessingMode.sport,
+        2 => zmin.ProcessingMode.turbo,
+        else => null,
+    };
+}
+
+/// Map a minification error to its C API error code
+fn errorCode(err: anyerror) c_int {
+    return switch (err) {
+        error.InvalidJson => -1,
+        error.OutOfMemory => -2,
+        error.InputOutput, error.BrokenPipe, error.NoSpaceLeft, error.AccessDenied => -6,
+        else => -99,
+    };
+}
+
 /// Minify JSON with specified mode
 /// mode: 0 = ECO, 1 = SPORT, 2 = TURBO
 export fn zmin_minify_mode(input: [*c]const u8, input_size: usize, mode: c_int) ZminResult {
@@ -43,15 +66,10 @@ export fn zmin_minify_mode(input: [*c]const u8, input_size: usize, mode: c_int)
     };
 
     // Convert mode
-    const processing_mode = switch (mode) {
-        0 => zmin.ProcessingMode.eco,
-        1 => zmin.ProcessingMode.sport,
-        2 => zmin.ProcessingMode.turbo,
-        else => return ZminResult{
-            .data = null,
-            .size = 0,
-            .error_code = -3, // Invalid mode
-        },
+    const processing_mode = modeFromInt(mode) orelse return ZminResult{
+        .data = null,
+        .size = 0,
+        .error_code = -3, // Invalid mode
     };
 
     // Get input slice
@@ -59,16 +77,10 @@ export fn zmin_minify_mode(input: [*c]const u8, input_size: usize, mode: c_int)
 
     // Minify
     const output = zmin.minifyWithMode(allocator, input_slice, processing_mode) catch |err| {
-        const error_code: c_int = switch (err) {
-            error.InvalidJson => -1,
-            error.OutOfMemory => -2,
-            else => -99,
-        };
-
         return ZminResult{
             .data = null,
             .size = 0,
-            .error_code = error_code,
+            .error_code = errorCode(err),
         };
     };
 
@@ -92,6 +104,142 @@ export fn zmin_minify_mode(input: [*c]const u8, input_size: usize, mode: c_int)
     };
 }
 
+/// Minify JSON into a caller-provided buffer
+/// Avoids the intermediate C string allocation and copy of zmin_minify_mode,
+/// so bindings can have the output written straight into their own buffer.
+/// Minified output is never larger than the input, so an output buffer of
+/// input_size bytes is always enough.
+/// Returns 0 on success (with the output length in output_size) or an error
+/// code; -4 means the output buffer was too small.
+export fn zmin_minify_into(input: [*c]const u8, input_size: usize, mode: c_int, output: [*c]u8, output_capacity: usize, output_size: *usize) c_int {
+    const allocator = c_allocator orelse return -99; // Not initialized
+    const processing_mode = modeFromInt(mode) orelse return -3; // Invalid mode
+
+    const minified = zmin.minifyWithMode(allocator, input[0..input_size], processing_mode) catch |err| {
+        return errorCode(err);
+    };
+    defer allocator.free(minified);
+
+    if (minified.len > output_capacity) {
+        return -4; // Output buffer too small
+    }
+
+    @memcpy(output[0..minified.len], minified);
+    output_size.* = minified.len;
+    return 0;
+}
+
+/// Minify a batch of JSON documents in one call
+/// outputs must have room for count results. Each result carries its own
+/// error_code; release them with zmin_free_batch (or zmin_free_result each).
+export fn zmin_minify_batch(inputs: [*c]const [*c]const u8, input_sizes: [*c]const usize, count: usize, mode: c_int, outputs: [*c]ZminResult) void {
+    for (0..count) |i| {
+        outputs[i] = zmin_minify_mode(inputs[i], input_sizes[i], mode);
+    }
+}
+
+/// Minify a batch of JSON documents, returning results as parallel arrays
+/// Same as zmin_minify_batch, but output pointers, sizes and error codes are
+/// written to three separate arrays of count entries each, which callers can
+/// scan without unpacking a struct per document. Release the outputs with
+/// zmin_free_batch_soa.
+export fn zmin_minify_batch_soa(inputs: [*c]const [*c]const u8, input_sizes: [*c]const usize, count: usize, mode: c_int, output_data: [*c][*c]u8, output_sizes: [*c]usize, output_errors: [*c]c_int) void {
+    for (0..count) |i| {
+        const result = zmin_minify_mode(inputs[i], input_sizes[i], mode);
+        output_data[i] = result.data;
+        output_sizes[i] = result.size;
+        output_errors[i] = result.error_code;
+    }
+}
+
+/// Minify JSON from one file descriptor to another (POSIX only)
+/// Runs the ECO minifier, which reads the input and writes the output in
+/// fixed-size chunks, so memory use is constant regardless of input size.
+/// Returns 0 on success or an error code; -5 means unsupported platform.
+export fn zmin_minify_stream(input_fd: c_int, output_fd: c_int) c_int {
+    if (comptime builtin.os.tag == .windows) {
+        return -5; // Not supported
+    } else {
+        const allocator = c_allocator orelse return -99; // Not initialized
+
+        const input = std.fs.File{ .handle = input_fd };
+        const output = std.fs.File{ .handle = output_fd };
+
+        zmin.MinifierInterface.minify(allocator, .eco, input.reader(), output.writer()) catch |err| {
+            return errorCode(err);
+        };
+        return 0;
+    }
+}
+
+/// Minify or pretty-print JSON in a single pass
+/// With pretty = 0 this is zmin_minify_mode; otherwise the streaming parser
+/// re-emits the input with indent spaces per nesting level, so callers do not
+/// need to minify and then format separately. Release the result with
+/// zmin_free_result.
+export fn zmin_reformat(input: [*c]const u8, input_size: usize, mode: c_int, pretty: c_int, indent: c_int) ZminResult {
+    if (pretty == 0) {
+        return zmin_minify_mode(input, input_size, mode);
+    }
+
+    const allocator = c_allocator orelse return ZminResult{
+        .data = null,
+        .size = 0,
+        .error_code = -99, // Not initialized
+    };
+    const indent_size = std.math.cast(u8, indent) orelse return ZminResult{
+        .data = null,
+        .size = 0,
+        .error_code = -7, // Invalid argument
+    };
+
+    var output = std.ArrayList(u8).init(allocator);
+    defer output.deinit();
+    const output_writer = output.writer();
+
+    var parser = zmin.minifier.MinifyingParser.initPretty(allocator, output_writer.any(), indent_size) catch {
+        return ZminResult{ .data = null, .size = 0, .error_code = -2 };
+    };
+    defer parser.deinit(allocator);
+
+    parser.feed(input[0..input_size]) catch |err| {
+        return ZminResult{ .data = null, .size = 0, .error_code = errorCode(err) };
+    };
+    parser.flush() catch |err| {
+        return ZminResult{ .data = null, .size = 0, .error_code = errorCode(err) };
+    };
+    if (!isComplete(&parser, output.items)) {
+        return ZminResult{ .data = null, .size = 0, .error_code = -1 }; // Truncated document
+    }
+
+    // Null-terminated, sized exactly as zmin_free_result expects
+    const c_output = output.toOwnedSliceSentinel(0) catch {
+        return ZminResult{ .data = null, .size = 0, .error_code = -2 };
+    };
+
+    return ZminResult{
+        .data = c_output.ptr,
+        .size = c_output.len,
+        .error_code = 0,
+    };
+}
+
+/// Whether the streaming parser has seen a complete document
+/// feed() accepts any prefix of a valid document, so a truncated one (e.g.
+/// an unclosed object) only shows in the state left once the input ends,
+/// together with the output written for it: a value must have been started
+/// (empty or whitespace-only input is not a document), and the parser must
+/// be back at top level, or inside a top-level number (which has no end
+/// marker) that ends in a digit, ruling out "-", "1." and "1e+".
+fn isComplete(parser: *const zmin.minifier.MinifyingParser, output: []const u8) bool {
+    if (parser.context_depth != 1 or output.len == 0) return false;
+    return switch (parser.state) {
+        .TopLevel => true,
+        .Number, .NumberDecimal, .NumberExponentSign => std.ascii.isDigit(output[output.len - 1]),
+        else => false,
+    };
+}
+
 /// Validate JSON
 /// Returns 0 for valid, error code for invalid
 export fn zmin_validate(input: [*c]const u8, input_size: usize) c_int {
@@ -109,12 +257,36 @@ export fn zmin_validate(input: [*c]const u8, input_size: usize) c_int {
 
 /// Free a result allocated by zmin
 export fn zmin_free_result(result: *ZminResult) void {
-    if (result.data != null and result.size > 0) {
+    zmin_free_result_data(result.data, result.size);
+    result.data = null;
+    result.size = 0;
+}
+
+/// Free a result's output given its data pointer and size
+/// Same as zmin_free_result, for callers that hold the fields rather than a
+/// pointer to the struct (e.g. a result returned by value to ctypes).
+export fn zmin_free_result_data(data: [*c]u8, size: usize) void {
+    // Empty results still own their null terminator
+    if (data != null) {
         const allocator = c_allocator orelse return;
-        const slice = result.data[0 .. result.size + 1]; // +1 for null terminator
+        const slice = data[0 .. size + 1]; // +1 for null terminator
         allocator.free(slice);
-        result.data = null;
-        result.size = 0;
+    }
+}
+
+/// Free all results filled in by zmin_minify_batch
+export fn zmin_free_batch(results: [*c]ZminResult, count: usize) void {
+    for (results[0..count]) |*result| {
+        zmin_free_result(result);
+    }
+}
+
+/// Free all outputs filled in by zmin_minify_batch_soa
+export fn zmin_free_batch_soa(output_data: [*c][*c]u8, output_sizes: [*c]usize, count: usize) void {
+    for (0..count) |i| {
+        zmin_free_result_data(output_data[i], output_sizes[i]);
+        output_data[i] = null;
+        output_sizes[i] = 0;
     }
 }
 
@@ -125,6 +297,10 @@ export fn zmin_get_error_message(error_code: c_int) [*c]const u8 {
         -1 => "Invalid JSON",
         -2 => "Out of memory",
         -3 => "Invalid mode",
+        -4 => "Output buffer too small",
+        -5 => "Not supported on this platform",
+        -6 => "I/O error",
+        -7 => "Invalid argument",
         -99 => "Unknown error",
         else => "Unknown error code",
     };
@@ -11,14 +11,12 @@ pub fn handleTopLevel(parser: *types.MinifyingParser, byte: u8) !void {
             try pretty.writeByte(parser, byte);
             try parser.pushContext(types.Context.Object);
             pretty.increaseIndent(parser);
-            try pretty.writeNewline(parser);
             parser.state = types.State.ObjectStart;
         },
         '[' => {
             try pretty.writeByte(parser, byte);
             try parser.pushContext(types.Context.Array);
             pretty.increaseIndent(parser);
-            try pretty.writeNewline(parser);
             parser.state = types.State.ArrayStart;
         },
         '"' => {
@@ -56,9 +54,8 @@ pub fn handleObjectStart(parser: *types.MinifyingParser, byte: u8) !void {
 
     switch (byte) {
         '}' => {
+            // Empty container: closes on the same line
             pretty.decreaseIndent(parser);
-            try pretty.writeNewline(parser);
-            try pretty.writeIndentIfNeeded(parser);
             try pretty.writeByte(parser, byte);
             _ = parser.popContext();
             const context = parser.getCurrentContext();
@@ -69,6 +66,7 @@ pub fn handleObjectStart(parser: *types.MinifyingParser, byte: u8) !void {
             }
         },
         '"' => {
+            try pretty.writeNewline(parser);
             try pretty.writeIndentIfNeeded(parser);
             try pretty.writeByte(parser, byte);
             parser.state = types.State.ObjectKeyString;
@@ -85,6 +83,7 @@ pub fn handleObjectKey(parser: *types.MinifyingParser, byte: u8) !void {
 
     switch (byte) {
         '"' => {
+            try pretty.writeIndentIfNeeded(parser);
             try pretty.writeByte(parser, byte);
             parser.state = types.State.ObjectKeyString;
         },
@@ -146,6 +145,7 @@ pub fn handleObjectColon(parser: *types.MinifyingParser, byte: u8) !void {
     switch (byte) {
         ':' => {
             try pretty.writeByte(parser, byte);
+            if (parser.pretty) try pretty.writeByte(parser, ' ');
             parser.state = types.State.ObjectValue;
         },
         else => {
@@ -167,14 +167,12 @@ pub fn handleObjectValue(parser: *types.MinifyingParser, byte: u8) !void {
             try pretty.writeByte(parser, byte);
             try parser.pushContext(types.Context.Object);
             pretty.increaseIndent(parser);
-            try pretty.writeNewline(parser);
             parser.state = types.State.ObjectStart;
         },
         '[' => {
             try pretty.writeByte(parser, byte);
             try parser.pushContext(types.Context.Array);
             pretty.increaseIndent(parser);
-            try pretty.writeNewline(parser);
             parser.state = types.State.ArrayStart;
         },
         't' => {
@@ -234,9 +232,8 @@ pub fn handleArrayStart(parser: *types.MinifyingParser, byte: u8) !void {
 
     switch (byte) {
         ']' => {
+            // Empty container: closes on the same line
             pretty.decreaseIndent(parser);
-            try pretty.writeNewline(parser);
-            try pretty.writeIndentIfNeeded(parser);
             try pretty.writeByte(parser, byte);
             _ = parser.popContext();
             const context = parser.getCurrentContext();
@@ -247,7 +244,7 @@ pub fn handleArrayStart(parser: *types.MinifyingParser, byte: u8) !void {
             }
         },
         else => {
-            try pretty.writeIndentIfNeeded(parser);
+            try pretty.writeNewline(parser);
             parser.state = types.State.ArrayValue;
             try handleArrayValue(parser, byte);
         },
@@ -256,6 +253,7 @@ pub fn handleArrayStart(parser: *types.MinifyingParser, byte: u8) !void {
 
 pub fn handleArrayValue(parser: *types.MinifyingParser, byte: u8) !void {
     if (utils.isWhitespace(byte)) return;
+    try pretty.writeIndentIfNeeded(parser);
 
     switch (byte) {
         '"' => {
@@ -266,14 +264,12 @@ pub fn handleArrayValue(parser: *types.MinifyingParser, byte: u8) !void {
             try pretty.writeByte(parser, byte);
             try parser.pushContext(types.Context.Object);
             pretty.increaseIndent(parser);
-            try pretty.writeNewline(parser);
             parser.state = types.State.ObjectStart;
         },
         '[' => {
             try pretty.writeByte(parser, byte);
             try parser.pushContext(types.Context.Array);
             pretty.increaseIndent(parser);
-            try pretty.writeNewline(parser);
             parser.state = types.State.ArrayStart;
         },
         't' => {
@@ -26,7 +26,7 @@ pub fn writeBytes(parser: *types.MinifyingParser, bytes: []const u8) !void {
 pub fn writeIndent(parser: *types.MinifyingParser) !void {
     if (!parser.pretty) return;
 
-    const indent_spaces = parser.indent_level * parser.indent_size;
+    const indent_spaces = @as(usize, parser.indent_level) * parser.indent_size;
     var i: usize = 0;
     while (i < indent_spaces) : (i += 1) {
         try writeByte(parser, ' ');
@@ -566,3 +566,88 @@ test "edge cases - scientific notation variations" {
 
     try testing.expectEqualStrings(expected, output.items);
 }
+
+/// Pretty-print input with the given indent and compare against the layout of
+/// Python's json.dumps(indent=...), which the CLI and bindings promise
+fn expectPretty(input: []const u8, indent: u8, expected: []const u8) !void {
+    var output = std.ArrayList(u8).init(testing.allocator);
+    defer output.deinit();
+
+    var parser = try MinifyingParser.initPretty(testing.allocator, output.writer().any(), indent);
+    defer parser.deinit(testing.allocator);
+
+    try parser.feed(input);
+    try parser.flush();
+
+    try testing.expectEqualStrings(expected, output.items);
+}
+
+test "pretty printing - nested objects and arrays" {
+    const input = "{ \"a\" : { \"b\" : { \"c\" : [ 1 , 2.5 , -3e10 ] } , \"d\" : \"x\" } , \"e\" : true , \"f\" : null }";
+    const expected =
+        \\{
+        \\  "a": {
+        \\    "b": {
+        \\      "c": [
+        \\        1,
+        \\        2.5,
+        \\        -3e10
+        \\      ]
+        \\    },
+        \\    "d": "x"
+        \\  },
+        \\  "e": true,
+        \\  "f": null
+        \\}
+    ;
+    try expectPretty(input, 2, expected);
+}
+
+test "pretty printing - indent size" {
+    const expected =
+        \\{
+        \\    "a": [
+        \\        1,
+        \\        {
+        \\            "b": null
+        \\        }
+        \\    ]
+        \\}
+    ;
+    try expectPretty("{\"a\":[1,{\"b\":null}]}", 4, expected);
+}
+
+test "pretty printing - empty containers" {
+    const expected =
+        \\{
+        \\  "a": {},
+        \\  "b": [],
+        \\  "c": [
+        \\    {},
+        \\    []
+        \\  ]
+        \\}
+    ;
+    try expectPretty("{\"a\":{},\"b\":[ ],\"c\":[{ },[]]}", 2, expected);
+    try expectPretty("{}", 2, "{}");
+    try expectPretty("[]", 2, "[]");
+}
+
+test "pretty printing - array of objects" {
+    const expected =
+        \\[
+        \\  {
+        \\    "id": 1,
+        \\    "tags": [
+        \\      "x",
+        \\      "y"
+        \\    ]
+        \\  },
+        \\  {
+        \\    "id": 2,
+        \\    "tags": []
+        \\  }
+        \\]
+    ;
+    try expectPretty("[{\"id\":1,\"tags\":[\"x\",\"y\"]},{\"id\":2,\"tags\":[]}]", 2, expected);
+}
@@ -1,84 +1,274 @@
 #!/usr/bin/env python3
 """Generate test JSON datasets for performance benchmarking."""
 
+import argparse
+import contextlib
 import json
+import multiprocessing
 import os
 import random
 import string
 
+# Single generator, seeded so that the datasets are reproducible (see
+# _seed_dataset). Its bound methods are looked up once here (and into locals
+# in the hot loops) rather than through the random module on every draw.
+_SEED = 42
+_rng = random.Random(_SEED)
+_random = _rng.random
+_getrandbits = _rng.getrandbits
+
+# Characters used for random keys and string values
+_ALPHABET = string.ascii_letters + string.digits
+
+# Maps random bytes onto the alphabet for bytes.translate. Bytes at or above
+# the largest multiple of the alphabet size are deleted instead, so that
+# every character stays equally likely.
+_BYTE_TO_CHAR = bytes(ord(_ALPHABET[b % len(_ALPHABET)]) for b in range(256))
+_UNEVEN_BYTES = bytes(range(256 - 256 % len(_ALPHABET), 256))
+
+# Random characters generated in bulk, consumed by generate_random_string
+_chars = ''
+_chars_pos = 0
+
+# Item types drawn with getrandbits(2), so there must be exactly 4
+_ITEM_TYPES = ("user", "product", "order", "event")
+
+# Cumulative probabilities for the kind of each value in a nested object, so
+# that a single draw picks it: 30% array, 35% nested object, and the other
+# 35% split evenly between string, number, boolean and null
+_P_ARRAY = 0.3
+_P_OBJECT = 0.65
+_P_STRING = 0.7375
+_P_NUMBER = 0.825
+_P_BOOLEAN = 0.9125
+
+# Fields of the items' data objects with --flat: (key, kind, min length,
+# max length), the lengths being those of string values
+_FLAT_SCHEMA = (
+    ("name", "string", 5, 20),
+    ("email", "string", 10, 30),
+    ("description", "string", 20, 50),
+    ("category", "string", 5, 15),
+    ("price", "number", 0, 0),
+    ("quantity", "number", 0, 0),
+    ("rating", "number", 0, 0),
+    ("active", "boolean", 0, 0),
+    ("verified", "boolean", 0, 0),
+    ("parent", "null", 0, 0),
+)
+
+# Formatted numbers in [-1000, 1000), indexed with getrandbits(14) instead of
+# drawing and formatting a float for every number value
+_number_rng = random.Random(_SEED)
+_NUMBERS = [repr(_number_rng.random() * 2000 - 1000) for _ in range(1 << 14)]
+del _number_rng
+
+# Timestamp prefixes for every minute of the day and suffixes for every
+# second, joined by _random_timestamp instead of formatting each time
+_TIMESTAMP_MINUTES = [f"2025-07-26T{h:02d}:{m:02d}:" for h in range(24) for m in range(60)]
+_TIMESTAMP_SECONDS = [f"{s:02d}Z" for s in range(60)]
+
+def _seed_dataset(name):
+    """
+    Reseed the generator for a dataset.
+    
+    Each dataset's contents then depend only on its name, not on which
+    datasets were generated before it in the same process.
+    """
+    global _chars, _chars_pos
+    _rng.seed(f"{_SEED}:{name}")
+    _chars, _chars_pos = '', 0
+
+def _randint(a, b):
+    """Random integer in [a, b], without random.randint's argument checks."""
+    # random.randint/choice/uniform are Python-level wrappers that cost
+    # several times more than the random() and getrandbits() calls they
+    # make, so the generator draws from those directly
+    return a + int(_random() * (b - a + 1))
+
+def _random_timestamp():
+    """Random time of day on the dataset date, from a single draw."""
+    minute, second = divmod(int(_random() * 86400), 60)
+    return _TIMESTAMP_MINUTES[minute] + _TIMESTAMP_SECONDS[second]
+
 def generate_random_string(length):
     """Generate a random string of specified length."""
-    return ''.join(random.choices(string.ascii_letters + string.digits, k=length))
+    # Slice from a buffer of random characters; refilling it maps 64 KiB of
+    # random bytes at once in C rather than drawing per character
+    global _chars, _chars_pos
+    end = _chars_pos + length
+    if end > len(_chars):
+        _chars = _rng.randbytes(1 << 16).translate(_BYTE_TO_CHAR, _UNEVEN_BYTES).decode('ascii')
+        _chars_pos, end = 0, length
+    text = _chars[_chars_pos:end]
+    _chars_pos = end
+    return text
 
-def generate_nested_object(depth, max_keys=5):
-    """Generate a nested JSON object."""
-    if depth == 0:
-        return generate_random_string(random.randint(5, 20))
+def emit_nested_object(parts, depth, newline, max_keys=5):
+    """
+    Append the JSON text of a random nested object (depth >= 1) to parts.
     
-    obj = {}
-    num_keys = random.randint(1, max_keys)
+    The text is indented as by json.dumps(indent=2), with newline being the
+    line break and indentation of the line the object starts on.
+    """
+    # Recursive: text must be emitted in order, and depth is at most 5
+    rand = _random
+    getrandbits = _getrandbits
+    randint = _randint
+    random_string = generate_random_string
+    append = parts.append
     
-    for _ in range(num_keys):
-        key = generate_random_string(random.randint(5, 15))
-        if random.random() < 0.3:  # 30% chance of array
-            obj[key] = [generate_nested_object(depth - 1) for _ in range(random.randint(1, 5))]
-        elif random.random() < 0.5:  # 50% chance of nested object
-            obj[key] = generate_nested_object(depth - 1)
-        else:  # Simple value
-            value_type = random.choice(['string', 'number', 'boolean', 'null'])
-            if value_type == 'string':
-                obj[key] = generate_random_string(random.randint(10, 50))
-            elif value_type == 'number':
-                obj[key] = random.uniform(-1000, 1000)
-            elif value_type == 'boolean':
-                obj[key] = random.choice([True, False])
+    inner = newline + '  '
+    separator = '{' + inner
+    for _ in range(randint(1, max_keys)):
+        # Keys and strings come from _ALPHABET, so they never need escaping
+        append(separator + '"' + random_string(randint(5, 15)) + '": ')
+        separator = ',' + inner
+        
+        x = rand()
+        if x < _P_ARRAY:
+            element = inner + '  '
+            if depth == 1:
+                strings = [random_string(randint(5, 20)) for _ in range(randint(1, 5))]
+                append('[' + element + '"' + ('",' + element + '"').join(strings) + '"' + inner + ']')
+            else:
+                element_separator = '[' + element
+                for _ in range(randint(1, 5)):
+                    append(element_separator)
+                    element_separator = ',' + element
+                    emit_nested_object(parts, depth - 1, element, max_keys)
+                append(inner + ']')
+        elif x < _P_OBJECT:
+            if depth == 1:
+                append('"' + random_string(randint(5, 20)) + '"')
             else:
-                obj[key] = None
+                emit_nested_object(parts, depth - 1, inner, max_keys)
+        elif x < _P_STRING:
+            append('"' + random_string(randint(10, 50)) + '"')
+        elif x < _P_NUMBER:
+            append(_NUMBERS[getrandbits(14)])
+        elif x < _P_BOOLEAN:
+            append('true' if getrandbits(1) else 'false')
+        else:
+            append('null')
     
-    return obj
+    append(newline + '}')
 
-def generate_dataset(name, target_size_mb):
-    """Generate a JSON dataset of approximately the target size."""
+def emit_flat_object(parts, newline):
+    """
+    Append the JSON text of an object with the _FLAT_SCHEMA fields to parts.
+    
+    Indented as by emit_nested_object; only the values are random.
+    """
+    inner = newline + '  '
+    separator = '{' + inner
+    for key, kind, min_length, max_length in _FLAT_SCHEMA:
+        if kind == 'string':
+            value = '"' + generate_random_string(_randint(min_length, max_length)) + '"'
+        elif kind == 'number':
+            value = _NUMBERS[_getrandbits(14)]
+        elif kind == 'boolean':
+            value = 'true' if _getrandbits(1) else 'false'
+        else:
+            value = 'null'
+        parts.append(separator + '"' + key + '": ' + value)
+        separator = ',' + inner
+    parts.append(newline + '}')
+
+def generate_dataset(name, target_size_mb, compact=False, flat=False):
+    """
+    Generate a JSON dataset of approximately the target size.
+    
+    With compact, a minified copy is written alongside it as <name>.min.json
+    (the expected minifier output), in the same pass. With flat, each item's
+    data is a flat object with the fixed _FLAT_SCHEMA fields instead of a
+    random nested tree: more, smaller items that are quicker to generate.
+    """
     print(f"Generating {name} dataset (~{target_size_mb}MB)...")
+    _seed_dataset(name)
     
-    # Generate data until we reach target size
-    data = {
-        "metadata": {
-            "dataset": name,
-            "version": "1.0",
-            "generated": "2025-07-26"
-        },
-        "items": []
+    metadata = {
+        "dataset": name,
+        "version": "1.0",
+        "generated": "2025-07-26"
     }
     
     current_size = 0
     target_bytes = target_size_mb * 1024 * 1024
     
-    while current_size < target_bytes:
-        item = {
-            "id": len(data["items"]),
-            "type": random.choice(["user", "product", "order", "event"]),
-            "timestamp": f"2025-07-26T{random.randint(0,23):02d}:{random.randint(0,59):02d}:{random.randint(0,59):02d}Z",
-            "data": generate_nested_object(random.randint(2, 5))
-        }
+    # Items are written as JSON text as they are generated, without building
+    # them as Python objects first, so memory use does not grow with the
+    # dataset. The output is the same as json.dump(data, f, indent=2): pretty
+    # printing leaves whitespace to minify.
+    output_path = f"benchmarks/datasets/{name}.json"
+    compact_path = f"benchmarks/datasets/{name}.min.json"
+    with open(output_path, 'wb', buffering=1 << 20) as f, \
+            (open(compact_path, 'wb', buffering=1 << 20) if compact else contextlib.nullcontext()) as compact_f:
+        metadata_text = json.dumps(metadata, indent=2).replace('\n', '\n  ')
+        header = ('{\n  "metadata": ' + metadata_text + ',\n  "items": [').encode('utf-8')
+        f.write(header)
+        current_size += len(header)
+        if compact:
+            metadata_text = json.dumps(metadata, separators=(',', ':'))
+            compact_f.write(('{"metadata":' + metadata_text + ',"items":[').encode('utf-8'))
         
-        data["items"].append(item)
+        count = 0
+        separator = '\n    '
+        next_progress = target_bytes / 10
+        while current_size < target_bytes:
+            parts = [
+                separator,
+                '{\n      "id": ', str(count),
+                ',\n      "type": "', _ITEM_TYPES[_getrandbits(2)],
+                '",\n      "timestamp": "', _random_timestamp(),
+                '",\n      "data": '
+            ]
+            if flat:
+                emit_flat_object(parts, '\n      ')
+            else:
+                emit_nested_object(parts, _randint(2, 5), '\n      ')
+            parts.append('\n    }')
+            
+            chunk = ''.join(parts).encode('ascii')
+            f.write(chunk)
+            current_size += len(chunk)
+            if compact:
+                # No generated value contains spaces or newlines, so deleting
+                # them leaves exactly the compact encoding
+                compact_f.write(chunk.translate(None, b' \n'))
+            separator = ',\n    '
+            
+            count += 1
+            if current_size >= next_progress:
+                print(f"  {name}: {current_size / target_bytes * 100:.1f}%")
+                # A large item can cross several steps at once
+                while next_progress <= current_size:
+                    next_progress += target_bytes / 10
         
-        # Estimate current size
-        if len(data["items"]) % 100 == 0:
-            current_size = len(json.dumps(data))
-            print(f"  Progress: {current_size / target_bytes * 100:.1f}%")
-    
-    # Write to file with pretty printing (includes whitespace to minify)
-    output_path = f"benchmarks/datasets/{name}.json"
-    with open(output_path, 'w') as f:
-        json.dump(data, f, indent=2)
+        f.write(b'\n  ]\n}')
+        if compact:
+            compact_f.write(b']}')
     
     actual_size = os.path.getsize(output_path) / (1024 * 1024)
     print(f"  Generated {output_path} ({actual_size:.2f}MB)")
+    if compact:
+        print(f"  Generated {compact_path} ({os.path.getsize(compact_path) / (1024 * 1024):.2f}MB)")
 
 def main():
     """Generate benchmark datasets."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="also write minified copies (<name>.min.json) of each dataset"
+    )
+    parser.add_argument(
+        "--flat",
+        action="store_true",
+        help="give items a fixed flat schema instead of random nested data"
+    )
+    args = parser.parse_args()
+    
     os.makedirs("benchmarks/datasets", exist_ok=True)
     
     # Generate datasets of different sizes
@@ -88,8 +278,13 @@ def main():
         ("large", 10),     # 10MB
     ]
     
-    for name, size_mb in datasets:
-        generate_dataset(name, size_mb)
+    # The datasets are independent, so they are generated in parallel
+    processes = min(len(datasets), os.cpu_count() or 1)
+    with multiprocessing.Pool(processes) as pool:
+        pool.starmap(
+            generate_dataset,
+            [(name, size_mb, args.compact, args.flat) for name, size_mb in datasets]
+        )
     
     print("\nDataset generation complete!")
 